@@ -1,6 +1,12 @@
 import streamlit as st
 import sqlite3
 import pandas as pd
+import pyarrow as pa
+import csv
+import io
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from datetime import datetime
 
 # Page configuration
@@ -13,10 +19,49 @@ st.title("Student Data Storing Application")
 
 DATABASE_FILE = "data.db"
 
+# Email format check, compiled once at import instead of on every submit
+EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+# Per-connection tuning for the shared connection. NORMAL sync is safe under
+# WAL (set once in init_database) while avoiding an fsync on every commit.
+SQLITE_PRAGMAS = [
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",  # ~64 MB page cache
+    "PRAGMA mmap_size=268435456",  # 256 MB memory-mapped I/O
+    "PRAGMA foreign_keys=ON",
+]
+
+# SQL statements, kept as constants so the exact same text is reused on every
+# call and SQLite's per-connection statement cache always hits
+INSERT_USER_SQL = "INSERT INTO users (name, email, phone, age) VALUES (?, ?, ?, ?)"
+SELECT_ALL_USERS_SQL = "SELECT id, name, email, phone, age, date_created FROM users ORDER BY id DESC"
+SELECT_USERS_PAGE_SQL = SELECT_ALL_USERS_SQL + " LIMIT ? OFFSET ?"
+SELECT_USER_BY_ID_SQL = "SELECT id, name, email, phone, age, date_created FROM users WHERE id = ?"
+SELECT_USER_IDS_SQL = "SELECT id, name FROM users ORDER BY id DESC"
+COUNT_USERS_SQL = "SELECT COUNT(*) FROM users"
+UPDATE_USER_SQL = "UPDATE users SET name = ?, email = ?, phone = ?, age = ? WHERE id = ?"
+DELETE_USER_SQL = "DELETE FROM users WHERE id = ?"
+
+def apply_pragmas(conn):
+    """
+    Apply the performance PRAGMAs to a database connection.
+    
+    Args:
+        conn (sqlite3.Connection): The connection to configure
+    """
+    for pragma in SQLITE_PRAGMAS:
+        conn.execute(pragma)
+
+@st.cache_resource
 def init_database():
     """
     Initialize the SQLite database and create the table if it doesn't exist.
-    This function is called on app startup.
+    This function is cached, so the schema setup runs once per process.
+    
+    Returns:
+        bool: True if email uniqueness is enforced, False if existing
+        duplicate emails prevented creating the unique index
     """
     conn = sqlite3.connect(DATABASE_FILE)
     cursor = conn.cursor()
@@ -33,21 +78,197 @@ def init_database():
         )
     """)
     
+    # Covering index for the (id, name) selectbox listing, newest first
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_users_id_name ON users(id DESC, name)")
+    
+    # Unique index on email: lets SQLite reject duplicate emails itself and
+    # also serves email-based lookups. An index (rather than a UNIQUE column
+    # constraint) also applies to databases created before this existed.
+    try:
+        cursor.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_users_email ON users(email)")
+        email_unique = True
+    except sqlite3.IntegrityError:
+        email_unique = False
+    
     conn.commit()
+    
+    # WAL lets readers run alongside the writer; the journal mode is
+    # persisted in the database file, so setting it once here is enough
+    conn.execute("PRAGMA journal_mode=WAL")
     conn.close()
+    
+    return email_unique
 
+@st.cache_resource
 def get_connection():
     """
-    Create and return a database connection.
+    Create and return a shared database connection.
+    The connection is cached across reruns so it is opened only once.
     """
-    conn = sqlite3.connect(DATABASE_FILE)
+    # Make sure the schema exists before the first query
+    init_database()
+    
+    conn = sqlite3.connect(
+        DATABASE_FILE,
+        check_same_thread=False,
+        isolation_level=None,
+        cached_statements=256,
+    )
     conn.row_factory = sqlite3.Row  # Access columns by name
+    apply_pragmas(conn)
     return conn
 
+# Seconds to wait for a queued write before reporting an error
+WRITE_TIMEOUT = 10
+
+# Shown when a write outlives WRITE_TIMEOUT but is still going to complete
+WRITE_PENDING_MESSAGE = "⏳ The database is busy; this change is still being saved and will appear shortly."
+
+class WritePendingError(Exception):
+    """
+    Raised when a write timed out but was already running and will still complete.
+    """
+
+@st.cache_resource
+def get_write_executor():
+    """
+    Return the executor that runs all database writes.
+    A single worker keeps writes serialized on the shared connection.
+    """
+    return ThreadPoolExecutor(max_workers=1)
+
+@st.cache_resource
+def get_data_version_state():
+    """
+    Return the process-wide data version counter and the lock guarding it.
+    Cached reads are keyed on this version, so it must be shared by every
+    session rather than kept in st.session_state.
+    """
+    return {"version": 0, "lock": threading.Lock()}
+
+def get_data_version():
+    """
+    Return the current data version, used as the cache key for reads.
+    """
+    return get_data_version_state()["version"]
+
+def bump_data_version(state=None):
+    """
+    Increment the data version so every session re-reads the database.
+    
+    Args:
+        state (dict): Version state to bump; defaults to the cached one
+    """
+    state = state or get_data_version_state()
+    with state["lock"]:
+        state["version"] += 1
+
+def run_write(func, *args):
+    """
+    Run a database write on the write executor and wait for it to finish.
+    The data version is bumped as soon as the write finishes, including on
+    failure, since a rolled-back write may already have been read.
+    
+    Args:
+        func (callable): The function performing the write
+        *args: Arguments passed to func
+    
+    Returns:
+        The return value of func
+    
+    Raises:
+        TimeoutError: If the write was still queued after WRITE_TIMEOUT and was cancelled
+        WritePendingError: If the write was already running after WRITE_TIMEOUT
+    """
+    # Resolve the cached state here: the worker thread has no script context
+    state = get_data_version_state()
+    
+    def write_and_bump():
+        try:
+            return func(*args)
+        finally:
+            bump_data_version(state)
+    
+    with st.spinner("Saving changes..."):
+        future = get_write_executor().submit(write_and_bump)
+        try:
+            return future.result(timeout=WRITE_TIMEOUT)
+        except FutureTimeoutError:
+            if future.cancel():
+                raise TimeoutError("timed out waiting for the database; the change was not saved")
+            # The write is already running and will land; invalidate cached
+            # reads now as well so no session keeps showing the old data
+            bump_data_version(state)
+            raise WritePendingError()
+
 # ============================================================================
 # CREATE OPERATION
 # ============================================================================
 
+# Columns expected in an imported CSV file
+IMPORT_COLUMNS = ["name", "email", "phone", "age"]
+
+# Maximum number of row errors listed when an import is rejected
+MAX_IMPORT_ERRORS = 5
+
+def validate_user(name, email, phone, age):
+    """
+    Validate user fields with the rules used by the forms and the CSV import.
+    
+    Args:
+        name (str): User's name
+        email (str): User's email
+        phone (str): User's phone number
+        age (int): User's age
+    
+    Returns:
+        str: An error message, or None if the fields are valid
+    """
+    if not name or not email or not phone:
+        return "Please fill in all fields!"
+    if not EMAIL_RE.match(email):
+        return "Please enter a valid email address!"
+    if age is None or not 1 <= age <= 120:
+        return "Age must be between 1 and 120!"
+    return None
+
+def parse_import_rows(import_df):
+    """
+    Convert and validate the rows of an imported CSV file.
+    
+    Args:
+        import_df (DataFrame): CSV data read with every column as text
+    
+    Returns:
+        tuple: (rows, errors) where rows is a list of (name, email, phone, age)
+        tuples and errors is a list of messages for the invalid rows
+    """
+    rows = []
+    errors = []
+    email_lines = {}  # First line each email was seen on
+    
+    # Line 1 of the file is the header, so data rows start at line 2
+    for line, (name, email, phone, age_text) in enumerate(
+        import_df[IMPORT_COLUMNS].itertuples(index=False, name=None), start=2
+    ):
+        name, email, phone, age_text = name.strip(), email.strip(), phone.strip(), age_text.strip()
+        
+        # Plain ASCII digits only: int() would also accept "1_0" or "+5"
+        if not (age_text.isascii() and age_text.isdigit()):
+            errors.append(f"Line {line}: Age '{age_text}' is not a whole number!")
+            continue
+        
+        error = validate_user(name, email, phone, int(age_text))
+        if error:
+            errors.append(f"Line {line}: {error}")
+        elif email in email_lines:
+            errors.append(f"Line {line}: Email '{email}' is repeated from line {email_lines[email]}!")
+        else:
+            email_lines[email] = line
+            rows.append((name, email, phone, int(age_text)))
+    
+    return rows, errors
+
 def insert_user(name, email, phone, age):
     """
     Insert a new user into the database.
@@ -59,83 +280,248 @@ def insert_user(name, email, phone, age):
         age (int): User's age
     
     Returns:
-        bool: True if insertion was successful, False otherwise
+        bool: True if insertion was successful, False otherwise,
+        or None if the write is still pending
     """
     try:
         conn = get_connection()
-        cursor = conn.cursor()
         
-        cursor.execute("""
-            INSERT INTO users (name, email, phone, age)
-            VALUES (?, ?, ?, ?)
-        """, (name, email, phone, age))
+        run_write(conn.execute, INSERT_USER_SQL, (name, email, phone, age))
         
-        conn.commit()
-        conn.close()
         return True
+    except sqlite3.IntegrityError:
+        st.error(f"Email '{email}' already exists!")
+        return False
+    except WritePendingError:
+        st.warning(WRITE_PENDING_MESSAGE)
+        return None
     except Exception as e:
         st.error(f"Error inserting user: {e}")
         return False
 
+def insert_users_bulk(rows):
+    """
+    Insert many users in a single transaction.
+    
+    Args:
+        rows (iterable): Iterable of (name, email, phone, age) tuples
+    
+    Returns:
+        bool: True if all rows were inserted, False otherwise,
+        or None if the write is still pending
+    """
+    try:
+        # Make sure the schema exists before writing
+        init_database()
+        
+        # Run the transaction on a dedicated connection so sessions reading
+        # through the shared connection never see the uncommitted rows. The
+        # connection is in autocommit mode, so the transaction is explicit.
+        def insert_batch():
+            conn = sqlite3.connect(DATABASE_FILE, isolation_level=None)
+            try:
+                conn.execute("BEGIN")
+                try:
+                    conn.executemany(INSERT_USER_SQL, rows)
+                    conn.execute("COMMIT")
+                except Exception:
+                    conn.execute("ROLLBACK")
+                    raise
+            finally:
+                conn.close()
+        
+        run_write(insert_batch)
+        
+        return True
+    except sqlite3.IntegrityError:
+        st.error("One or more emails in the file already exist!")
+        return False
+    except WritePendingError:
+        st.warning(WRITE_PENDING_MESSAGE)
+        return None
+    except Exception as e:
+        st.error(f"Error importing users: {e}")
+        return False
+
 # ============================================================================
 # READ OPERATION
 # ============================================================================
 
-def view_all_users():
+# Cached readers are keyed on the data version, which every write bumps, so
+# old entries are never read again; max_entries bounds what they keep alive.
+# The cached load_* functions let errors propagate, and their uncached
+# wrappers report them, so a transient failure is never cached for every
+# session.
+
+USER_COLUMNS = ["id", "name", "email", "phone", "age", "date_created"]
+
+USER_SCHEMA = pa.schema([
+    ("id", pa.int64()),
+    ("name", pa.string()),
+    ("email", pa.string()),
+    ("phone", pa.string()),
+    ("age", pa.int64()),
+    ("date_created", pa.string()),
+])
+
+def users_to_dataframe(rows):
     """
-    Retrieve all users from the database.
+    Build an Arrow-backed users DataFrame from fetched rows.
+    The columns are typed up front, so Streamlit can send them to the
+    browser without converting object-dtype columns to Arrow first.
+    
+    Args:
+        rows (list): Rows of (id, name, email, phone, age, date_created)
     
     Returns:
-        DataFrame: A pandas DataFrame containing all users
+        DataFrame: A pandas DataFrame with pyarrow-backed columns
+    """
+    columns = list(zip(*rows)) or [()] * len(USER_SCHEMA)
+    table = pa.Table.from_arrays(
+        [pa.array(values, type=field.type) for values, field in zip(columns, USER_SCHEMA)],
+        schema=USER_SCHEMA,
+    )
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+def iter_csv(batch_size=1000):
+    """
+    Stream all users as CSV text, reading the table in batches.
+    
+    Args:
+        batch_size (int): Number of rows fetched from SQLite per batch
+    
+    Yields:
+        str: CSV text for the header, then for each batch of rows
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(USER_COLUMNS)
+    yield buffer.getvalue()
+    
+    cursor = get_connection().execute(SELECT_ALL_USERS_SQL)
+    for batch in iter(lambda: cursor.fetchmany(batch_size), []):
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(batch)
+        yield buffer.getvalue()
+
+@st.cache_data(show_spinner=False, max_entries=1)
+def export_csv(version):
+    """
+    Build the CSV export of all users.
+    
+    Args:
+        version (int): Data version, used as the cache key
+    
+    Returns:
+        bytes: UTF-8 encoded CSV data
+    """
+    return "".join(iter_csv()).encode("utf-8")
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def load_users_page(page, page_size, version):
+    """
+    Load one page of users from the database, newest first.
+    
+    Args:
+        page (int): Zero-based page number
+        page_size (int): Number of users per page
+        version (int): Data version, used as the cache key
+    
+    Returns:
+        DataFrame: A pandas DataFrame containing the users on the page
+    """
+    conn = get_connection()
+    rows = conn.execute(SELECT_USERS_PAGE_SQL, (page_size, page * page_size)).fetchall()
+    return users_to_dataframe(rows)
+
+def view_users_page(page, page_size, version):
+    """
+    Return the cached page of users, reporting database errors with st.error.
     """
     try:
-        conn = get_connection()
-        query = "SELECT id, name, email, phone, age, date_created FROM users ORDER BY id DESC"
-        df = pd.read_sql_query(query, conn)
-        conn.close()
-        return df
+        return load_users_page(page, page_size, version)
     except Exception as e:
         st.error(f"Error retrieving users: {e}")
-        return pd.DataFrame()
+        return pd.DataFrame(columns=USER_COLUMNS)
 
-def get_user_by_id(user_id):
+@st.cache_data(show_spinner=False, max_entries=32)
+def load_user_by_id(user_id, version):
     """
-    Retrieve a single user by ID.
+    Load a single user by ID.
     
     Args:
         user_id (int): The ID of the user to retrieve
+        version (int): Data version, used as the cache key
     
     Returns:
         tuple: User data tuple (id, name, email, phone, age, date_created)
     """
+    conn = get_connection()
+    cursor = conn.execute(SELECT_USER_BY_ID_SQL, (user_id,))
+    user = cursor.fetchone()
+    # sqlite3.Row can't be pickled into the cache, so store a plain tuple
+    return tuple(user) if user else None
+
+def get_user_by_id(user_id, version):
+    """
+    Return the cached user, reporting database errors with st.error.
+    """
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM users WHERE id = ?", (user_id,))
-        user = cursor.fetchone()
-        conn.close()
-        return user
+        return load_user_by_id(user_id, version)
     except Exception as e:
         st.error(f"Error retrieving user: {e}")
         return None
 
-def get_user_ids():
+@st.cache_data(show_spinner=False, max_entries=4)
+def load_user_ids(version):
     """
-    Retrieve all user IDs for selectbox options.
+    Load all user IDs for selectbox options.
+    
+    Args:
+        version (int): Data version, used as the cache key
     
     Returns:
-        list: List of tuples (id, name) for easy display
+        tuple: Tuple of (id, name) pairs for easy display
+    """
+    conn = get_connection()
+    users = conn.execute(SELECT_USER_IDS_SQL).fetchall()
+    return tuple((user[0], user[1]) for user in users)
+
+def get_user_ids(version):
+    """
+    Return the cached user list, reporting database errors with st.error.
     """
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT id, name FROM users ORDER BY id DESC")
-        users = cursor.fetchall()
-        conn.close()
-        return [(user[0], user[1]) for user in users]
+        return load_user_ids(version)
     except Exception as e:
         st.error(f"Error retrieving user list: {e}")
-        return []
+        return ()
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def load_user_count(version):
+    """
+    Count the users in the database without fetching any rows.
+    
+    Args:
+        version (int): Data version, used as the cache key
+    
+    Returns:
+        int: Number of users
+    """
+    conn = get_connection()
+    cursor = conn.execute(COUNT_USERS_SQL)
+    return cursor.fetchone()[0]
+
+def count_users(version):
+    """
+    Return the cached user count, reporting database errors with st.error.
+    """
+    try:
+        return load_user_count(version)
+    except Exception as e:
+        st.error(f"Error counting users: {e}")
+        return 0
 
 # ============================================================================
 # UPDATE OPERATION
@@ -153,21 +539,21 @@ def update_user(user_id, name, email, phone, age):
         age (int): Updated age
     
     Returns:
-        bool: True if update was successful, False otherwise
+        bool: True if update was successful, False otherwise,
+        or None if the write is still pending
     """
     try:
         conn = get_connection()
-        cursor = conn.cursor()
         
-        cursor.execute("""
-            UPDATE users
-            SET name = ?, email = ?, phone = ?, age = ?
-            WHERE id = ?
-        """, (name, email, phone, age, user_id))
+        run_write(conn.execute, UPDATE_USER_SQL, (name, email, phone, age, user_id))
         
-        conn.commit()
-        conn.close()
         return True
+    except sqlite3.IntegrityError:
+        st.error(f"Email '{email}' already exists!")
+        return False
+    except WritePendingError:
+        st.warning(WRITE_PENDING_MESSAGE)
+        return None
     except Exception as e:
         st.error(f"Error updating user: {e}")
         return False
@@ -184,15 +570,16 @@ def delete_user(user_id):
         user_id (int): The ID of the user to delete
     
     Returns:
-        bool: True if deletion was successful, False otherwise
+        bool: True if deletion was successful, False otherwise,
+        or None if the write is still pending
     """
     try:
         conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM users WHERE id = ?", (user_id,))
-        conn.commit()
-        conn.close()
+        run_write(conn.execute, DELETE_USER_SQL, (user_id,))
         return True
+    except WritePendingError:
+        st.warning(WRITE_PENDING_MESSAGE)
+        return None
     except Exception as e:
         st.error(f"Error deleting user: {e}")
         return False
@@ -201,14 +588,22 @@ def delete_user(user_id):
 # STREAMLIT UI
 # ============================================================================
 
-# Initialize database on app startup
-init_database()
+# Initialize database on app startup (runs once per process). If existing
+# duplicate emails blocked the unique index, tell each session once.
+if not init_database() and not st.session_state.get("duplicate_email_warned"):
+    st.session_state.duplicate_email_warned = True
+    st.warning("⚠️ Duplicate emails found in the database; email uniqueness is not enforced.")
 
-# Create tabs for different operations
-tab1, tab2, tab3, tab4 = st.tabs(["➕ Create", "📋 Read", "✏️ Update", "🗑️ Delete"])
+# Each tab is rendered by a fragment, so interacting with widgets in one tab
+# reruns only that tab. Successful writes trigger a full app rerun so the
+# other tabs and the footer pick up the new data.
 
 # ======================== CREATE TAB ========================
-with tab1:
+@st.fragment
+def render_create_tab():
+    """
+    Render the Create tab: the add-user form and the CSV import.
+    """
     st.header("Add New User")
     
     with st.form("add_user_form"):
@@ -227,54 +622,128 @@ with tab1:
         
         if submitted:
             # Validation
-            if not name or not email or not phone:
-                st.error("❌ Please fill in all fields!")
-            elif "@" not in email:
-                st.error("❌ Please enter a valid email address!")
+            error = validate_user(name, email, phone, age)
+            
+            if error:
+                st.error(f"❌ {error}")
             else:
                 # Insert the user
-                if insert_user(name, email, phone, age):
-                    st.success(f"✅ User '{name}' added successfully!")
-                else:
+                saved = insert_user(name, email, phone, age)
+                
+                if saved:
+                    st.toast(f"✅ User '{name}' added successfully!")
+                    st.rerun()
+                elif saved is False:
                     st.error("❌ Failed to add user!")
+    
+    # Bulk import from a CSV file with name, email, phone and age columns
+    with st.form("import_csv_form"):
+        uploaded_file = st.file_uploader("Import users from CSV", type="csv")
+        submitted_import = st.form_submit_button("📥 Import CSV", use_container_width=True)
+        
+        if submitted_import:
+            import_df = None
+            
+            if uploaded_file is None:
+                st.error("❌ Please choose a CSV file to import!")
+            else:
+                # Read every column as text (blank cells as ""), then validate
+                # each row with the same rules as the form
+                try:
+                    import_df = pd.read_csv(uploaded_file, dtype=str, keep_default_na=False)
+                except (pd.errors.EmptyDataError, pd.errors.ParserError, UnicodeDecodeError) as e:
+                    st.error(f"❌ Could not read the CSV file: {e}")
+            
+            if import_df is not None:
+                missing_columns = [col for col in IMPORT_COLUMNS if col not in import_df.columns]
+                rows, errors = ([], []) if missing_columns else parse_import_rows(import_df)
+                
+                if missing_columns:
+                    st.error(f"❌ CSV is missing columns: {', '.join(missing_columns)}")
+                elif import_df.empty:
+                    st.error("❌ The CSV file has no users to import!")
+                elif errors:
+                    shown_errors = "\n".join(f"- {error}" for error in errors[:MAX_IMPORT_ERRORS])
+                    more_errors = len(errors) - MAX_IMPORT_ERRORS
+                    if more_errors > 0:
+                        shown_errors += f"\n- ...and {more_errors} more"
+                    st.error(f"❌ Nothing was imported; {len(errors)} invalid rows:\n{shown_errors}")
+                else:
+                    saved = insert_users_bulk(rows)
+                    
+                    if saved:
+                        st.toast(f"✅ Imported {len(rows)} users successfully!")
+                        st.rerun()
+                    elif saved is False:
+                        st.error("❌ Failed to import users!")
 
 # ======================== READ TAB ========================
-with tab2:
+@st.fragment
+def render_read_tab():
+    """
+    Render the Read tab: one page of users at a time.
+    """
     st.header("View All Users")
     
-    # Refresh button
+    # Refresh button: bump the data version so cached reads are re-fetched
     if st.button("🔄 Refresh Data", use_container_width=True):
+        bump_data_version()
         st.rerun()
     
-    # Retrieve and display all users
-    users_df = view_all_users()
+    total_users = count_users(get_data_version())
     
-    if users_df.empty:
+    if total_users == 0:
         st.info("📭 No users found. Add one using the 'Create' tab!")
     else:
-        st.subheader(f"Total Users: {len(users_df)}")
+        st.subheader(f"Total Users: {total_users}")
+        
+        # Pagination controls
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            page_size = st.number_input("Rows per page", min_value=10, max_value=500, value=50, step=10, key="page_size")
+        
+        total_pages = (total_users + page_size - 1) // page_size
+        
+        # Keep the current page in range when rows are deleted or the page size grows
+        if "page" not in st.session_state:
+            st.session_state.page = 1
+        elif st.session_state.page > total_pages:
+            st.session_state.page = total_pages
         
-        # Display as dataframe with formatting
-        st.dataframe(
-            users_df,
-            use_container_width=True,
-            hide_index=True,
-            column_config={
-                "id": st.column_config.NumberColumn("ID", width="small"),
-                "name": st.column_config.TextColumn("Name", width="medium"),
-                "email": st.column_config.TextColumn("Email", width="medium"),
-                "phone": st.column_config.TextColumn("Phone", width="small"),
-                "age": st.column_config.NumberColumn("Age", width="small"),
-                "date_created": st.column_config.TextColumn("Created", width="medium"),
-            }
+        with col2:
+            page = st.number_input(f"Page (of {total_pages})", min_value=1, max_value=total_pages, key="page")
+        
+        # Retrieve and display only the current page of users
+        users_df = view_users_page(page - 1, page_size, get_data_version())
+        
+        # Display as a static table; paging replaces interactive scrolling/sorting
+        st.table(
+            users_df.rename(columns={
+                "id": "ID",
+                "name": "Name",
+                "email": "Email",
+                "phone": "Phone",
+                "age": "Age",
+                "date_created": "Created",
+            }).set_index("ID")
         )
 
 # ======================== UPDATE TAB ========================
-with tab3:
+@st.fragment
+def render_update_tab(user_list):
+    """
+    Render the Update tab.
+    
+    Args:
+        user_list (tuple): (id, name) pairs for the user selectbox
+    """
     st.header("Update User Information")
     
-    # Get list of users
-    user_list = get_user_ids()
+    # Conflict reported by the previous run, after the form was reloaded
+    update_conflict = st.session_state.pop("update_conflict", None)
+    if update_conflict:
+        st.error(f"❌ {update_conflict}")
     
     if not user_list:
         st.info("📭 No users found. Add one using the 'Create' tab!")
@@ -287,44 +756,83 @@ with tab3:
         )
         
         selected_user_id = selected_option[0]
-        user_data = get_user_by_id(selected_user_id)
         
-        if user_data:
-            st.info(f"Editing: **{user_data[1]}** (ID: {user_data[0]})")
+        # Seed the keyed edit widgets from the database only when the
+        # selection or the stored row changes; on other reruns they already
+        # hold their values and the lookup is skipped. Never reseed on the
+        # run that submits the form, or the user's input would be replaced.
+        version = get_data_version()
+        submitting = st.session_state.get("update_user_submit", False)
+        
+        if not submitting and st.session_state.get("edit_seed") != (selected_user_id, version):
+            user_data = get_user_by_id(selected_user_id, version)
+            
+            if not user_data:
+                st.session_state.edit_uid = None
+            elif st.session_state.get("edit_uid") != selected_user_id or st.session_state.get("edit_row") != user_data:
+                st.session_state[f"edit_name_{selected_user_id}"] = user_data[1]
+                st.session_state[f"edit_email_{selected_user_id}"] = user_data[2]
+                st.session_state[f"edit_phone_{selected_user_id}"] = user_data[3]
+                st.session_state[f"edit_age_{selected_user_id}"] = user_data[4]
+                st.session_state.edit_uid = selected_user_id
+                st.session_state.edit_row = user_data
+            
+            st.session_state.edit_seed = (selected_user_id, version)
+        
+        if st.session_state.get("edit_uid") == selected_user_id:
+            st.info(f"Editing: **{selected_option[1]}** (ID: {selected_user_id})")
             
             with st.form("update_user_form"):
                 col1, col2 = st.columns(2)
                 
                 with col1:
-                    updated_name = st.text_input("Full Name", value=user_data[1])
-                    updated_email = st.text_input("Email", value=user_data[2])
+                    updated_name = st.text_input("Full Name", key=f"edit_name_{selected_user_id}")
+                    updated_email = st.text_input("Email", key=f"edit_email_{selected_user_id}")
                 
                 with col2:
-                    updated_phone = st.text_input("Phone Number", value=user_data[3])
-                    updated_age = st.number_input("Age", min_value=1, max_value=120, value=user_data[4])
+                    updated_phone = st.text_input("Phone Number", key=f"edit_phone_{selected_user_id}")
+                    updated_age = st.number_input("Age", min_value=1, max_value=120, key=f"edit_age_{selected_user_id}")
                 
                 # Submit button
-                submit_update = st.form_submit_button("✅ Save Changes", use_container_width=True)
+                submit_update = st.form_submit_button("✅ Save Changes", use_container_width=True, key="update_user_submit")
                 
                 if submit_update:
                     # Validation
-                    if not updated_name or not updated_email or not updated_phone:
-                        st.error("❌ Please fill in all fields!")
-                    elif "@" not in updated_email:
-                        st.error("❌ Please enter a valid email address!")
+                    error = validate_user(updated_name, updated_email, updated_phone, updated_age)
+                    
+                    # The row the form was seeded from must still match the database
+                    current_data = get_user_by_id(selected_user_id, get_data_version())
+                    
+                    if error:
+                        st.error(f"❌ {error}")
+                    elif current_data != st.session_state.get("edit_row"):
+                        # Changed elsewhere: rerun so the form reloads the latest row
+                        # and report it there, without saving over the other change
+                        if current_data:
+                            st.session_state.update_conflict = "This user was changed elsewhere; the form has been reloaded. Please re-apply your changes."
+                        else:
+                            st.session_state.update_conflict = "This user was deleted elsewhere; nothing was saved."
+                        st.rerun()
                     else:
                         # Update the user
-                        if update_user(selected_user_id, updated_name, updated_email, updated_phone, updated_age):
-                            st.success(f"✅ User updated successfully!")
-                        else:
+                        saved = update_user(selected_user_id, updated_name, updated_email, updated_phone, updated_age)
+                        
+                        if saved:
+                            st.toast("✅ User updated successfully!")
+                            st.rerun()
+                        elif saved is False:
                             st.error("❌ Failed to update user!")
 
 # ======================== DELETE TAB ========================
-with tab4:
-    st.header("Delete User")
+@st.fragment
+def render_delete_tab(user_list):
+    """
+    Render the Delete tab.
     
-    # Get list of users
-    user_list = get_user_ids()
+    Args:
+        user_list (tuple): (id, name) pairs for the user selectbox
+    """
+    st.header("Delete User")
     
     if not user_list:
         st.info("📭 No users found. Add one using the 'Create' tab!")
@@ -349,15 +857,35 @@ with tab4:
         
         with col1:
             if st.button("🗑️ Delete User", use_container_width=True, type="primary"):
-                if delete_user(selected_user_id):
-                    st.success(f"✅ User '{selected_user_name}' deleted successfully!")
+                saved = delete_user(selected_user_id)
+                
+                if saved:
+                    st.toast(f"✅ User '{selected_user_name}' deleted successfully!")
                     st.rerun()
-                else:
+                elif saved is False:
                     st.error("❌ Failed to delete user!")
         
         with col2:
             st.button("❌ Cancel", use_container_width=True)
 
+# Create tabs for different operations
+tab1, tab2, tab3, tab4 = st.tabs(["➕ Create", "📋 Read", "✏️ Update", "🗑️ Delete"])
+
+# User list shared by the Update and Delete tabs, fetched once per rerun
+user_list = get_user_ids(get_data_version())
+
+with tab1:
+    render_create_tab()
+
+with tab2:
+    render_read_tab()
+
+with tab3:
+    render_update_tab(user_list)
+
+with tab4:
+    render_delete_tab(user_list)
+
 # ============================================================================
 # FOOTER
 # ============================================================================
@@ -365,24 +893,23 @@ with tab4:
 st.divider()
 col1, col2, col3 = st.columns(3)
 
+# Count once for both the export button and the metric
+total_records = count_users(get_data_version())
+
 with col1:
-    if st.button("📊 Export to CSV", use_container_width=True):
-        df = view_all_users()
-        if not df.empty:
-            csv = df.to_csv(index=False)
-            st.download_button(
-                label="Download CSV",
-                data=csv,
-                file_name=f"users_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                mime="text/csv",
-                use_container_width=True
-            )
-        else:
-            st.info("No data to export!")
+    if total_records > 0:
+        st.download_button(
+            label="📊 Export to CSV",
+            data=export_csv(get_data_version()),
+            file_name=f"users_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+            mime="text/csv",
+            use_container_width=True
+        )
+    else:
+        st.info("No data to export!")
 
 with col2:
-    db_stats = view_all_users()
-    st.metric("Total Records", len(db_stats))
+    st.metric("Total Records", total_records)
 
 with col3:
     st.info(f"📁 Database: `{DATABASE_FILE}`")